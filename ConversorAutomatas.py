@@ -1,7 +1,16 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
 import math
+import os
+import re
+import multiprocessing
+from array import array
+from multiprocessing import shared_memory
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+from collections import deque
 import graphviz
+import numpy as np
 from PIL import Image, ImageTk  # Para mostrar los png en Tkinter
 
 import ExpresionesRegulares
@@ -56,12 +65,28 @@ class State:
     def __init__(self, state_id, is_accepting=False):
         self.state_id = state_id
         self.is_accepting = is_accepting
-        self.transitions = {}  # {symbol: [State, State, ...]}
+        self.transitions = {}  # {symbol: {State, State, ...}}
+        self.predecessors = {}  # {symbol: {State, State, ...}} (índice inverso)
 
     def add_transition(self, symbol, target_state):
         if symbol not in self.transitions:
-            self.transitions[symbol] = []
-        self.transitions[symbol].append(target_state)
+            self.transitions[symbol] = set()
+        self.transitions[symbol].add(target_state)
+        if symbol not in target_state.predecessors:
+            target_state.predecessors[symbol] = set()
+        target_state.predecessors[symbol].add(self)
+
+    def remove_transition(self, symbol, target_state):
+        destinos = self.transitions.get(symbol)
+        if destinos is None or target_state not in destinos:
+            return
+        destinos.discard(target_state)
+        if not destinos:
+            del self.transitions[symbol]
+        origenes = target_state.predecessors[symbol]
+        origenes.discard(self)
+        if not origenes:
+            del target_state.predecessors[symbol]
 
     def get_epsilon_closure(self):
         closure = set()
@@ -83,11 +108,7 @@ class State:
         return False
 
     def has_transition_to(self, target_state):
-        for destinos in self.transitions.values():
-            for dest in destinos:
-                if dest.state_id == target_state:
-                    return True
-        return False
+        return any(target_state in destinos for destinos in self.transitions.values())
 
 class Automaton:
     def __init__(self):
@@ -113,6 +134,15 @@ class Automaton:
         to_state = self.states[to_state_id]
         from_state.add_transition(symbol, to_state)
 
+    def has_transition(self, from_state_id, to_state_id, symbol=None):
+        from_state = self.states.get(from_state_id)
+        to_state = self.states.get(to_state_id)
+        if from_state is None or to_state is None:
+            return False
+        if symbol is None:
+            return from_state.has_transition_to(to_state)
+        return from_state.has_transition_with_symbol(to_state, symbol)
+
     def get_epsilon_closure(self, state_id):
         if state_id not in self.states:
             raise ValueError(f"State {state_id} does not exist!")
@@ -134,6 +164,76 @@ class Automaton:
         self.states = new_states
         self.start_state = self.states['q0']
 
+    def _useful_states(self):
+        # Estados accesibles desde el inicial (BFS hacia adelante) que además
+        # llegan a un estado de aceptación (búsqueda sobre el grafo inverso).
+        alcanzables = {self.start_state}
+        cola = deque([self.start_state])
+        while cola:
+            actual = cola.popleft()
+            for destinos in actual.transitions.values():
+                for destino in destinos:
+                    if destino not in alcanzables:
+                        alcanzables.add(destino)
+                        cola.append(destino)
+        utiles = {s for s in alcanzables if s.is_accepting}
+        cola = deque(utiles)
+        while cola:
+            actual = cola.popleft()
+            for origenes in actual.predecessors.values():
+                for origen in origenes:
+                    if origen in alcanzables and origen not in utiles:
+                        utiles.add(origen)
+                        cola.append(origen)
+        return utiles
+
+    def trim(self):
+        # Elimina en tiempo lineal los estados inaccesibles y los estados muertos
+        if not self.start_state:
+            return self
+        utiles = self._useful_states()
+        utiles.add(self.start_state)  # El estado inicial siempre se conserva
+        for state_id in list(self.states):
+            if self.states[state_id] not in utiles:
+                self.remove_state(state_id)
+        return self
+
+    def remove_state(self, state_id):
+        if state_id not in self.states:
+            raise ValueError(f"Estado {state_id} no existe!")
+        state = self.states.pop(state_id)
+        if state is self.start_state:
+            self.start_state = None
+        for symbol, origenes in list(state.predecessors.items()):
+            for origen in list(origenes):
+                origen.remove_transition(symbol, state)
+        for symbol, destinos in list(state.transitions.items()):
+            for destino in list(destinos):
+                state.remove_transition(symbol, destino)
+
+    def reverse(self):
+        # Autómata reverso: invierte cada transición usando el índice de predecesores.
+        # Un nuevo estado inicial alcanza por λ a los antiguos estados de aceptación.
+        if not self.start_state:
+            raise ValueError("The automaton has no start state defined.")
+        reverso = Automaton()
+        for state_id, state in self.states.items():
+            reverso.add_state(state_id, is_accepting=(state is self.start_state))
+        for state_id, state in self.states.items():
+            for symbol, origenes in state.predecessors.items():
+                for origen in origenes:
+                    reverso.add_transition(state_id, symbol, origen.state_id)
+        indice_inicio = len(self.states)
+        while f"q{indice_inicio}" in reverso.states:
+            indice_inicio += 1
+        inicio = f"q{indice_inicio}"
+        reverso.add_state(inicio)
+        reverso.set_start_state(inicio)
+        for state_id, state in self.states.items():
+            if state.is_accepting:
+                reverso.add_transition(inicio, "λ", state_id)
+        return reverso
+
     def to_dfa(self):
         if not self.start_state:
             raise ValueError("The automaton has no start state defined.")
@@ -155,6 +255,7 @@ class Automaton:
                     dfa.add_state(target_state_id, any(s.is_accepting for s in target_closure))
                     unprocessed.append(target_closure)
                 dfa.add_transition(current_state_id, symbol, target_state_id)
+        dfa.trim()
         dfa.rename_states_sequentially()
         return dfa
 
@@ -173,6 +274,96 @@ class Automaton:
                     transitions[symbol].update(target.get_epsilon_closure())
         return transitions
 
+    def _bit_encoding(self):
+        # Codifica cada estado como un bit: retorna el orden de los estados, la máscara
+        # de la λ-clausura del inicial, la máscara de aceptación y, por símbolo, la
+        # unión de las λ-clausuras de los destinos de cada estado.
+        orden = list(self.states.values())
+        indices = {state: i for i, state in enumerate(orden)}
+        clausuras = []
+        for state in orden:
+            mascara = 0
+            for s in state.get_epsilon_closure():
+                mascara |= 1 << indices[s]
+            clausuras.append(mascara)
+        pasos = {}
+        for i, state in enumerate(orden):
+            for symbol, targets in state.transitions.items():
+                if symbol == "λ":
+                    continue
+                if symbol not in pasos:
+                    pasos[symbol] = [0] * len(orden)
+                for target in targets:
+                    pasos[symbol][i] |= clausuras[indices[target]]
+        aceptacion = 0
+        for i, state in enumerate(orden):
+            if state.is_accepting:
+                aceptacion |= 1 << i
+        inicio = clausuras[indices[self.start_state]] if self.start_state else 0
+        return orden, inicio, aceptacion, pasos
+
+    def to_dfa_parallel(self, processes=None):
+        """
+        Construcción de subconjuntos repartida entre varios procesos. Cada proceso es
+        dueño de los subconjuntos cuyo hash cae en su partición, los deduplica y calcula
+        sus sucesores; entre procesos solo viajan subconjuntos codificados como enteros.
+        El AFD resultante es idéntico al de to_dfa() salvo por el nombre de los estados,
+        que se numeran por orden de descubrimiento.
+        """
+        if not self.start_state:
+            raise ValueError("The automaton has no start state defined.")
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes <= 1:
+            return self.to_dfa()
+        _, inicio, aceptacion, pasos = self._bit_encoding()
+        conexiones = []
+        trabajadores = []
+        for _ in range(processes):
+            extremo_padre, extremo_hijo = multiprocessing.Pipe()
+            trabajador = multiprocessing.Process(target=_expandir_subconjuntos,
+                                                 args=(extremo_hijo, pasos), daemon=True)
+            trabajador.start()
+            extremo_hijo.close()
+            conexiones.append(extremo_padre)
+            trabajadores.append(trabajador)
+        expandidos = {}
+        try:
+            frontera = [[] for _ in range(processes)]
+            frontera[hash(inicio) % processes].append(inicio)
+            while any(frontera):
+                for conexion, lote in zip(conexiones, frontera):
+                    conexion.send(lote)
+                frontera = [[] for _ in range(processes)]
+                for conexion in conexiones:
+                    for mascara, sucesores in conexion.recv():
+                        expandidos[mascara] = sucesores
+                        for _, destino in sucesores:
+                            frontera[hash(destino) % processes].append(destino)
+        finally:
+            for conexion in conexiones:
+                try:
+                    conexion.send(None)
+                except OSError:
+                    pass  # El proceso ya terminó; no ocultar el error original
+                conexion.close()
+            for trabajador in trabajadores:
+                trabajador.join()
+        # Los estados se nombran por orden de descubrimiento (el inicial es q0) en lugar
+        # de construir el nombre de cada subconjunto, que luego se descartaría
+        dfa = Automaton()
+        nombres = {}
+        for mascara in expandidos:
+            nombres[mascara] = f"q{len(nombres)}"
+            dfa.add_state(nombres[mascara], bool(mascara & aceptacion))
+        dfa.set_start_state(nombres[inicio])
+        for mascara, sucesores in expandidos.items():
+            for symbol, destino in sucesores:
+                dfa.add_transition(nombres[mascara], symbol, nombres[destino])
+        dfa.trim()
+        dfa.rename_states_sequentially()
+        return dfa
+
     def convert_to_nfa(self):
         new_automaton = Automaton()
         for state_id, state in self.states.items():
@@ -195,13 +386,74 @@ class Automaton:
                     new_automaton.add_transition(state_id, symbol, target_state.state_id)
             if any(closure_state.is_accepting for closure_state in epsilon_closure):
                 new_automaton.states[state_id].is_accepting = True
+        new_automaton.trim()
         return new_automaton
 
+    def copy(self):
+        # Copia estructural: mismos identificadores, estados y transiciones nuevos
+        copia = Automaton()
+        mapa = {state: State(state.state_id, state.is_accepting) for state in self.states.values()}
+        for original, nuevo in mapa.items():
+            nuevo.transitions = {symbol: {mapa[t] for t in targets}
+                                 for symbol, targets in original.transitions.items()}
+            nuevo.predecessors = {symbol: {mapa[o] for o in origenes}
+                                  for symbol, origenes in original.predecessors.items()}
+        copia.states = {state.state_id: state for state in mapa.values()}
+        if self.start_state:
+            copia.start_state = mapa[self.start_state]
+        return copia
+
+    @staticmethod
+    def _repetir(fragmento, minimo, maximo):
+        # Repetición {m,n} / {m,}: se encadenan copias del fragmento, que se construyó una
+        # sola vez. Los estados de aceptación de la copia j pasan por λ a la copia j+1 y
+        # siguen siendo de aceptación si j >= m; con {m,} la última copia vuelve a su inicio.
+        copias = maximo if maximo is not None else max(minimo, 1)
+        if copias > ExpresionesRegulares.LIMITE_REPETICION:
+            raise ValueError(f"La repetición supera el límite de {ExpresionesRegulares.LIMITE_REPETICION} "
+                             "copias; use CountingMatcher para cotas grandes.")
+        automata = Automaton()
+        inicios = []
+        finales = []
+        for _ in range(copias):
+            nombres = {}
+            for state in fragmento.states.values():
+                nombres[state] = f"q{len(automata.states)}"
+                automata.add_state(nombres[state])
+            for state in fragmento.states.values():
+                for symbol, targets in state.transitions.items():
+                    for target in targets:
+                        automata.add_transition(nombres[state], symbol, nombres[target])
+            inicios.append(nombres[fragmento.start_state])
+            finales.append([nombres[s] for s in fragmento.states.values() if s.is_accepting])
+        for j in range(copias):
+            for final in finales[j]:
+                if j + 1 < copias:
+                    automata.add_transition(final, "λ", inicios[j + 1])
+                if j + 1 >= minimo:
+                    automata.states[final].is_accepting = True
+        if maximo is None:
+            for final in finales[-1]:
+                automata.add_transition(final, "λ", inicios[-1])
+        if minimo == 0:
+            # Nuevo inicial de aceptación sin transiciones de entrada para aceptar λ
+            nuevo_inicio = f"q{len(automata.states)}"
+            automata.add_state(nuevo_inicio, is_accepting=True)
+            if copias:
+                automata.add_transition(nuevo_inicio, "λ", inicios[0])
+            automata.set_start_state(nuevo_inicio)
+        else:
+            automata.set_start_state(inicios[0])
+        return automata
+
     def construir_desde_postfix(self, postfix):
         pila = []
         contador_estados = 0
-        for token in postfix:
-            if token == '&':  # Concatenación
+        for token in ExpresionesRegulares.tokenizar(postfix):
+            if ExpresionesRegulares.es_repeticion(token):  # Repetición acotada {m,n}
+                minimo, maximo = ExpresionesRegulares.rango_repeticion(token)
+                pila.append(self._repetir(pila.pop(), minimo, maximo))
+            elif token == '&':  # Concatenación
                 nfa2 = pila.pop()
                 nfa1 = pila.pop()
                 cantidad_estados_nfa1 = len(nfa1.states)
@@ -249,7 +501,10 @@ class Automaton:
                     for simbolo, destinos in estado.transitions.items():
                         for destino in destinos:
                             automata.add_transition(estado_id, simbolo, destino.state_id)
-                nuevo_inicio = State(f"q{len(automata.states)+1}")
+                indice_inicio = len(automata.states) + 1
+                while f"q{indice_inicio}" in automata.states:
+                    indice_inicio += 1
+                nuevo_inicio = State(f"q{indice_inicio}")
                 automata.add_state(nuevo_inicio.state_id)
                 automata.set_start_state(nuevo_inicio.state_id)
                 automata.add_transition(nuevo_inicio.state_id, "λ", nfa1.start_state.state_id)
@@ -281,13 +536,856 @@ class Automaton:
                 automata.add_transition(inicio.state_id, token, final.state_id)
                 pila.append(automata)
         nfa_final = pila.pop()
+        nfa_final.trim()
         nfa_final.rename_states_sequentially()
         return nfa_final
 
+    def construir_lote(self, postfixes):
+        """
+        Construye los autómatas de varias expresiones en notación postfix. Los patrones
+        idénticos se construyen una sola vez; cada repetición recibe una copia
+        independiente, por lo que modificar un resultado no afecta a los demás.
+        """
+        construidos = {}
+        resultado = []
+        for postfix in postfixes:
+            if postfix in construidos:
+                resultado.append(construidos[postfix].copy())
+            else:
+                construidos[postfix] = self.construir_desde_postfix(postfix)
+                resultado.append(construidos[postfix])
+        return resultado
+
+    def is_deterministic(self):
+        for state in self.states.values():
+            for symbol, targets in state.transitions.items():
+                if symbol == "λ" or len(targets) > 1:
+                    return False
+        return True
+
+    def _transfer_matrix(self):
+        # M[i][j] = número de símbolos que llevan del estado i al estado j (int64)
+        indices = {state: i for i, state in enumerate(self.states.values())}
+        n = len(indices)
+        matriz = np.zeros((n, n), dtype=np.int64)
+        for state, i in indices.items():
+            for targets in state.transitions.values():
+                for target in targets:
+                    matriz[i, indices[target]] += 1
+        inicio = np.zeros(n, dtype=np.int64)
+        inicio[indices[self.start_state]] = 1
+        finales = np.array([s.is_accepting for s in indices], dtype=np.int64)
+        return matriz, inicio, finales
+
+    def _counting_dfa(self, length):
+        if length < 0:
+            raise ValueError("La longitud debe ser no negativa.")
+        dfa = self if self.is_deterministic() else self.to_dfa()
+        if not dfa.start_state:
+            raise ValueError("The automaton has no start state defined.")
+        return dfa
+
+    def _fits_int64(self, length):
+        # Hay a lo sumo g^n caminos de longitud n si cada estado tiene g transiciones
+        # salientes, y toda entrada intermedia (potencias de M hasta M^n, productos
+        # vector-matriz y sus sumas parciales) cuenta caminos de longitud <= n.
+        grado = max((sum(len(t) for t in s.transitions.values()) for s in self.states.values()), default=0)
+        return max(grado, 1) ** length <= np.iinfo(np.int64).max
+
+    def _exact_counts(self, max_length):
+        # Respaldo exacto con enteros de Python cuando int64 podría desbordarse: avanza
+        # un vector disperso sobre la lista de aristas (O(n * aristas) operaciones).
+        indices = {state: i for i, state in enumerate(self.states.values())}
+        aristas = {}
+        for state, i in indices.items():
+            for targets in state.transitions.values():
+                for target in targets:
+                    aristas[i, indices[target]] = aristas.get((i, indices[target]), 0) + 1
+        aristas = list(aristas.items())
+        finales = [i for state, i in indices.items() if state.is_accepting]
+        vector = [0] * len(indices)
+        vector[indices[self.start_state]] = 1
+        for paso in range(max_length + 1):
+            yield sum(vector[i] for i in finales)
+            if paso == max_length:
+                return
+            siguiente = [0] * len(indices)
+            for (i, j), cantidad in aristas:
+                if vector[i]:
+                    siguiente[j] += vector[i] * cantidad
+            vector = siguiente
+
+    def count_accepted(self, length):
+        """
+        Cuenta las cadenas de longitud `length` aceptadas por el autómata con la matriz
+        de transferencia: pasos vector-matriz si `length` es menor que el número de
+        estados y exponenciación por cuadrados en otro caso. Se usa int64 cuando el
+        conteo cabe; si puede desbordarse, la matriz pasa a enteros exactos de Python
+        (dtype=object). En ese caso solo se avanza paso a paso sobre las aristas cuando
+        length * aristas es menor que el costo de las multiplicaciones de matrices
+        (estados^3 * log2(length)), como en AFD grandes con length moderado.
+        """
+        dfa = self._counting_dfa(length)
+        matriz, vector, finales = dfa._transfer_matrix()
+        if not dfa._fits_int64(length):
+            aristas = int(np.count_nonzero(matriz))
+            if length * aristas <= len(dfa.states) ** 3 * length.bit_length():
+                for conteo in dfa._exact_counts(length):
+                    pass
+                return conteo
+            matriz, vector, finales = matriz.astype(object), vector.astype(object), finales.astype(object)
+        if length < len(dfa.states):
+            for _ in range(length):
+                vector = vector @ matriz
+        else:
+            while length:
+                if length & 1:
+                    vector = vector @ matriz
+                length >>= 1
+                if length:
+                    matriz = matriz @ matriz
+        return int(vector @ finales)
+
+    def count_accepted_by_length(self, max_length):
+        """
+        Retorna una lista con el número de cadenas aceptadas de cada longitud
+        0..max_length, avanzando el vector de conteos un paso a la vez (en int64, o
+        con enteros de Python si los conteos pueden desbordar int64).
+        """
+        dfa = self._counting_dfa(max_length)
+        if not dfa._fits_int64(max_length):
+            return list(dfa._exact_counts(max_length))
+        matriz, vector, finales = dfa._transfer_matrix()
+        conteos = []
+        for _ in range(max_length + 1):
+            conteos.append(int(vector @ finales))
+            vector = vector @ matriz
+        return conteos
+
+    def enumerate_accepted(self, limit=None):
+        """
+        Generador que produce las cadenas aceptadas de menor a mayor longitud
+        (y en orden lexicográfico dentro de cada longitud) mediante BFS sobre el AFD.
+        """
+        dfa = self if self.is_deterministic() else self.to_dfa()
+        if not dfa.start_state:
+            raise ValueError("The automaton has no start state defined.")
+        # Solo se exploran estados útiles: toda rama del BFS termina en una cadena aceptada
+        utiles = dfa._useful_states()
+        if dfa.start_state not in utiles:
+            return  # Lenguaje vacío
+        producidas = 0
+        cola = deque([(dfa.start_state, "")])
+        while cola:
+            if limit is not None and producidas >= limit:
+                return
+            state, cadena = cola.popleft()
+            if state.is_accepting:
+                yield cadena
+                producidas += 1
+            for symbol in sorted(state.transitions):
+                for target in state.transitions[symbol]:
+                    if target in utiles:
+                        cola.append((target, cadena + symbol))
+
+    def match_batch(self, cadenas, processes=None):
+        """
+        Evalúa muchas cadenas contra el AFD y retorna una lista de booleanos. La tabla de
+        transiciones (estados x 256 bytes) se publica una sola vez en memoria compartida;
+        cada proceso recibe su lote empaquetado como un buffer de bytes más un arreglo de
+        desplazamientos y responde con un mapa de bits, sin serializar cadena por cadena.
+        Las cadenas que no caben en latin-1 se marcan aparte como rechazadas.
+
+        >>> dfa = Automaton().construir_desde_postfix("ab&+").convert_to_nfa().to_dfa()
+        >>> dfa.match_batch(["abab", "λ", "abab", "ab"] * 2, processes=1)
+        [True, False, True, True, True, False, True, True]
+        >>> dfa.match_batch(["abab", "λ", "abab", "ab"] * 2, processes=2)
+        [True, False, True, True, True, False, True, True]
+        """
+        if not self.start_state:
+            raise ValueError("The automaton has no start state defined.")
+        if not self.is_deterministic():
+            raise ValueError("El autómata debe ser determinista.")
+        if any(len(symbol) != 1 or ord(symbol) > 255 for state in self.states.values()
+               for symbol in state.transitions):
+            raise ValueError("Los símbolos deben ser caracteres de un byte (latin-1).")
+        if processes is None:
+            processes = os.cpu_count() or 1
+        indices = {state: i for i, state in enumerate(self.states.values())}
+        tabla = array("i", [-1]) * (len(indices) * 256)
+        for state, i in indices.items():
+            for symbol, targets in state.transitions.items():
+                tabla[i * 256 + ord(symbol)] = indices[next(iter(targets))]
+        aceptacion = bytes(state.is_accepting for state in indices)
+        inicio = indices[self.start_state]
+
+        # Empaqueta las cadenas por lotes; las que no caben en latin-1 nunca son aceptadas
+        cadenas = list(cadenas)
+        total = len(cadenas)
+        tamano_lote = max(1, -(-total // (processes * 4)))
+        lotes = []
+        for desde in range(0, total, tamano_lote):
+            partes = []
+            desplazamientos = array("q", [0])
+            rechazadas = bytearray()
+            fin = 0
+            for cadena in cadenas[desde:desde + tamano_lote]:
+                if isinstance(cadena, str):
+                    try:
+                        cadena = cadena.encode("latin-1")
+                    except UnicodeEncodeError:
+                        cadena = b""
+                        rechazadas.append(1)
+                    else:
+                        rechazadas.append(0)
+                else:
+                    rechazadas.append(0)
+                partes.append(cadena)
+                fin += len(cadena)
+                desplazamientos.append(fin)
+            lotes.append((b"".join(partes), desplazamientos.tobytes(), bytes(rechazadas)))
+
+        if processes <= 1 or len(lotes) <= 1:
+            mapas = [_aceptar_empaquetadas(tabla, aceptacion, inicio, buffer, desplazamientos, rechazadas)
+                     for buffer, desplazamientos, rechazadas in lotes]
+        else:
+            memoria = shared_memory.SharedMemory(create=True, size=max(1, len(tabla) * tabla.itemsize))
+            try:
+                memoria.buf[:len(tabla) * tabla.itemsize] = tabla.tobytes()
+                with multiprocessing.Pool(processes, initializer=_iniciar_trabajador_lote,
+                                          initargs=(memoria.name, len(tabla), aceptacion, inicio)) as pool:
+                    mapas = pool.starmap(_evaluar_lote, lotes)
+            finally:
+                memoria.close()
+                memoria.unlink()
+
+        resultado = []
+        for mapa in mapas:
+            cantidad = len(resultado)
+            resultado.extend(bool(mapa[k >> 3] >> (k & 7) & 1) for k in range(min(tamano_lote, total - cantidad)))
+        return resultado
+
     def __repr__(self):
         return f"Automaton(States: {list(self.states.keys())})"
 
 
+class BitParallelNFA:
+    """
+    Simulación de un AFN sin determinizar: el conjunto de estados activos es un único
+    entero (un bit por estado). Para cada símbolo se precalcula, por bloques de
+    `block_bits` estados, la unión de los sucesores de cada combinación de bits del
+    bloque, de modo que cada carácter cuesta unas pocas operaciones OR/AND/shift.
+    Las tablas por bloque se llenan bajo demanda.
+    """
+
+    def __init__(self, automaton, block_bits=8):
+        if not automaton.start_state:
+            raise ValueError("The automaton has no start state defined.")
+        if block_bits < 1:
+            raise ValueError("block_bits debe ser al menos 1.")
+        orden, self.inicio, self.aceptacion, self.sucesores = automaton._bit_encoding()
+        self.block_bits = block_bits
+        self.block_mask = (1 << block_bits) - 1
+        num_bloques = -(-len(orden) // block_bits)
+        self.tablas = {symbol: [{} for _ in range(num_bloques)] for symbol in self.sucesores}
+
+    def _union_bloque(self, symbol, bloque, valor):
+        sucesores = self.sucesores[symbol]
+        base = bloque * self.block_bits
+        union = 0
+        while valor:
+            bit = valor & -valor
+            union |= sucesores[base + bit.bit_length() - 1]
+            valor ^= bit
+        return union
+
+    def step(self, activos, symbol):
+        tabla = self.tablas.get(symbol)
+        if tabla is None:
+            return 0
+        siguiente = 0
+        bits = self.block_bits
+        while activos:
+            # Salta directamente al bloque del bit activo más bajo
+            bloque = ((activos & -activos).bit_length() - 1) // bits
+            desplazamiento = bloque * bits
+            valor = (activos >> desplazamiento) & self.block_mask
+            union = tabla[bloque].get(valor)
+            if union is None:
+                union = self._union_bloque(symbol, bloque, valor)
+                tabla[bloque][valor] = union
+            siguiente |= union
+            activos ^= valor << desplazamiento
+        return siguiente
+
+    def matches(self, cadena):
+        activos = self.inicio
+        for symbol in cadena:
+            activos = self.step(activos, symbol)
+            if not activos:
+                return False
+        return bool(activos & self.aceptacion)
+
+
+class CountingMatcher:
+    """
+    Reconocedor con contadores para repeticiones {m,n} grandes: el cuerpo de cada
+    repetición se compila una sola vez (construcción de Thompson) y el número de
+    vueltas se guarda en un contador de la configuración (nodo, contadores), en lugar
+    de copiar el cuerpo m o n veces como hace construir_desde_postfix. Las repeticiones
+    anidadas no se admiten: sus contadores se combinarían y el número de
+    configuraciones crecería como el producto de los límites.
+    """
+
+    def __init__(self, postfix):
+        self.simbolos = []  # nodo -> {símbolo: [nodo, ...]}
+        self.vacias = []  # nodo -> [(nodo, acción)], acción: None o (tipo, repetición)
+        self.limites = []  # repetición -> (mínimo, máximo)
+        pila = []  # [(inicio, fin, contiene_repeticion)]
+        for token in ExpresionesRegulares.tokenizar(postfix):
+            if token == '&':
+                segundo = pila.pop()
+                primero = pila.pop()
+                self._vacia(primero[1], segundo[0])
+                pila.append((primero[0], segundo[1], primero[2] or segundo[2]))
+            elif token == '|':
+                segundo = pila.pop()
+                primero = pila.pop()
+                inicio, fin = self._nodo(), self._nodo()
+                for fragmento in (primero, segundo):
+                    self._vacia(inicio, fragmento[0])
+                    self._vacia(fragmento[1], fin)
+                pila.append((inicio, fin, primero[2] or segundo[2]))
+            elif token in {'*', '+'}:
+                cuerpo = pila.pop()
+                inicio, fin = self._nodo(), self._nodo()
+                self._vacia(inicio, cuerpo[0])
+                self._vacia(cuerpo[1], cuerpo[0])
+                self._vacia(cuerpo[1], fin)
+                if token == '*':
+                    self._vacia(inicio, fin)
+                pila.append((inicio, fin, cuerpo[2]))
+            elif ExpresionesRegulares.es_repeticion(token):
+                cuerpo = pila.pop()
+                if cuerpo[2]:
+                    raise ValueError("CountingMatcher no admite repeticiones {m,n} anidadas; "
+                                     "use construir_desde_postfix para esa expresión.")
+                minimo, maximo = ExpresionesRegulares.rango_repeticion(token)
+                inicio, fin = self._nodo(), self._nodo()
+                if minimo == 0:
+                    self._vacia(inicio, fin)
+                if maximo != 0:
+                    repeticion = len(self.limites)
+                    self.limites.append((minimo, maximo))
+                    self._vacia(inicio, cuerpo[0], ("entrar", repeticion))
+                    self._vacia(cuerpo[1], cuerpo[0], ("repetir", repeticion))
+                    self._vacia(cuerpo[1], fin, ("salir", repeticion))
+                pila.append((inicio, fin, True))
+            else:
+                inicio, fin = self._nodo(), self._nodo()
+                self.simbolos[inicio].setdefault(token, []).append(fin)
+                pila.append((inicio, fin, False))
+        if len(pila) != 1:
+            raise ValueError("Expresión postfix inválida.")
+        self.inicio, self.fin, _ = pila.pop()
+
+    @classmethod
+    def from_regex(cls, expresion):
+        expresion_regular = ExpresionesRegulares.ExpresionRegular(expresion)
+        # Los contadores no copian el cuerpo, así que las cotas no se limitan
+        es_valida, mensaje = expresion_regular.validar_expresion(limite_repeticion=None)
+        if not es_valida:
+            raise ValueError(f"Expresión inválida: {mensaje}")
+        return cls(expresion_regular.convertir_a_postfix())
+
+    def _nodo(self):
+        self.simbolos.append({})
+        self.vacias.append([])
+        return len(self.simbolos) - 1
+
+    def _vacia(self, origen, destino, accion=None):
+        self.vacias[origen].append((destino, accion))
+
+    def _clausura(self, configuraciones):
+        # Sigue las transiciones vacías aplicando las acciones sobre los contadores.
+        # El contador guarda las vueltas completas; con {m,} se satura en m.
+        clausura = set(configuraciones)
+        pila = list(configuraciones)
+        while pila:
+            nodo, contadores = pila.pop()
+            for destino, accion in self.vacias[nodo]:
+                nuevos = contadores
+                if accion is not None:
+                    tipo, repeticion = accion
+                    minimo, maximo = self.limites[repeticion]
+                    vueltas = contadores[repeticion] + 1
+                    if tipo == "entrar":
+                        vueltas = 0
+                    elif tipo == "repetir":
+                        if maximo is not None and vueltas >= maximo:
+                            continue
+                        if maximo is None:
+                            vueltas = min(vueltas, minimo)
+                    elif vueltas < minimo:
+                        continue
+                    else:
+                        vueltas = 0
+                    nuevos = contadores[:repeticion] + (vueltas,) + contadores[repeticion + 1:]
+                configuracion = (destino, nuevos)
+                if configuracion not in clausura:
+                    clausura.add(configuracion)
+                    pila.append(configuracion)
+        return clausura
+
+    def matches(self, cadena):
+        configuraciones = self._clausura([(self.inicio, (0,) * len(self.limites))])
+        for symbol in cadena:
+            siguientes = []
+            for nodo, contadores in configuraciones:
+                for destino in self.simbolos[nodo].get(symbol, ()):
+                    siguientes.append((destino, contadores))
+            if not siguientes:
+                return False
+            configuraciones = self._clausura(siguientes)
+        return any(nodo == self.fin for nodo, _ in configuraciones)
+
+
+class PrefilteredSearcher:
+    """
+    Búsqueda no anclada con un AFD apoyada en literales obligatorios
+    (ExpresionRegular.extraer_literales). Con str.find/bytes.find se salta a las
+    posiciones candidatas y el autómata solo se ejecuta a partir de ellas.
+    """
+
+    def __init__(self, dfa, prefijos=None, factores=None):
+        if not dfa.start_state:
+            raise ValueError("The automaton has no start state defined.")
+        if not dfa.is_deterministic():
+            raise ValueError("El autómata debe ser determinista.")
+        self.inicio = dfa.start_state
+        # {estado: {símbolo: estado}} para recorrer el AFD sin conjuntos intermedios
+        self.delta = {state: {symbol: next(iter(targets)) for symbol, targets in state.transitions.items()}
+                      for state in dfa.states.values()}
+        self.prefijos = self._literales_utiles(prefijos)
+        self.factores = self._literales_utiles(factores)
+
+    @classmethod
+    def from_regex(cls, expresion):
+        expresion_regular = ExpresionesRegulares.ExpresionRegular(expresion)
+        es_valida, mensaje = expresion_regular.validar_expresion()
+        if not es_valida:
+            raise ValueError(f"Expresión inválida: {mensaje}")
+        postfix = expresion_regular.convertir_a_postfix()
+        dfa = Automaton().construir_desde_postfix(postfix).convert_to_nfa().to_dfa()
+        prefijos, factores = expresion_regular.extraer_literales()
+        return cls(dfa, prefijos, factores)
+
+    @staticmethod
+    def _literales_utiles(literales):
+        if not literales or "" in literales:
+            return None
+        return sorted(literales)
+
+    @staticmethod
+    def _posiciones(texto, literales, pos, limite):
+        # Recorre en orden las apariciones de cualquiera de los literales
+        siguientes = {literal: texto.find(literal, pos) for literal in literales}
+        while True:
+            vivas = [p for p in siguientes.values() if p != -1]
+            if not vivas:
+                return
+            actual = min(vivas)
+            if actual > limite:
+                return
+            yield actual
+            for literal, p in siguientes.items():
+                if p == actual:
+                    siguientes[literal] = texto.find(literal, actual + 1)
+
+    def match_at(self, texto, inicio):
+        # Coincidencia anclada más larga desde `inicio`: retorna la posición final o None
+        es_bytes = isinstance(texto, (bytes, bytearray))
+        estado = self.inicio
+        fin = inicio if estado.is_accepting else None
+        for i in range(inicio, len(texto)):
+            symbol = chr(texto[i]) if es_bytes else texto[i]
+            estado = self.delta[estado].get(symbol)
+            if estado is None:
+                break
+            if estado.is_accepting:
+                fin = i + 1
+        return fin
+
+    def search(self, texto, inicio=0):
+        """
+        Retorna (inicio, fin) de la coincidencia más a la izquierda (la más larga desde
+        ese inicio) o None si no hay coincidencia.
+        """
+        es_bytes = isinstance(texto, (bytes, bytearray))
+        limite = len(texto)
+        if self.factores:
+            factores = [f.encode("latin-1") for f in self.factores] if es_bytes else self.factores
+            # Toda coincidencia contiene un factor que empieza en o después de su inicio
+            limite = max(texto.rfind(f, inicio) for f in factores)
+            if limite == -1:
+                return None
+        if self.prefijos:
+            prefijos = [p.encode("latin-1") for p in self.prefijos] if es_bytes else self.prefijos
+            candidatos = self._posiciones(texto, prefijos, inicio, limite)
+        else:
+            candidatos = range(inicio, limite + 1)
+        for candidato in candidatos:
+            fin = self.match_at(texto, candidato)
+            if fin is not None:
+                return candidato, fin
+        return None
+
+
+def _aceptar_empaquetadas(tabla, aceptacion, inicio, buffer, desplazamientos, rechazadas):
+    # Recorre el AFD sobre cada cadena del lote y retorna un mapa de bits de aceptación.
+    # La cadena k ocupa buffer[desplazamientos[k]:desplazamientos[k + 1]]; si
+    # rechazadas[k] es 1 no pudo codificarse y nunca es aceptada.
+    desplazamientos = memoryview(desplazamientos).cast("q")
+    mapa = bytearray((len(desplazamientos) + 6) // 8)
+    for k in range(len(desplazamientos) - 1):
+        if rechazadas[k]:
+            continue
+        anterior, fin = desplazamientos[k], desplazamientos[k + 1]
+        estado = inicio
+        for byte in buffer[anterior:fin]:
+            estado = tabla[estado * 256 + byte]
+            if estado < 0:
+                break
+        if estado >= 0 and aceptacion[estado]:
+            mapa[k >> 3] |= 1 << (k & 7)
+    return bytes(mapa)
+
+
+_lote_compartido = {}
+
+
+def _iniciar_trabajador_lote(nombre, longitud, aceptacion, inicio):
+    # Cada proceso de match_batch se conecta una vez a la tabla en memoria compartida
+    memoria = shared_memory.SharedMemory(name=nombre)
+    _lote_compartido["memoria"] = memoria
+    _lote_compartido["tabla"] = memoria.buf[:longitud * 4].cast("i")
+    _lote_compartido["aceptacion"] = aceptacion
+    _lote_compartido["inicio"] = inicio
+
+
+def _evaluar_lote(buffer, desplazamientos, rechazadas):
+    return _aceptar_empaquetadas(_lote_compartido["tabla"], _lote_compartido["aceptacion"],
+                                 _lote_compartido["inicio"], buffer, desplazamientos, rechazadas)
+
+
+def _expandir_subconjuntos(conexion, pasos):
+    # Proceso de trabajo de to_dfa_parallel: recibe lotes de subconjuntos (enteros)
+    # de su partición, descarta los ya vistos y responde con los sucesores de cada uno.
+    vistos = set()
+    while True:
+        lote = conexion.recv()
+        if lote is None:
+            break
+        resultado = []
+        for mascara in lote:
+            if mascara in vistos:
+                continue
+            vistos.add(mascara)
+            sucesores = []
+            for symbol, paso in pasos.items():
+                destino = 0
+                resto = mascara
+                while resto:
+                    bit = resto & -resto
+                    destino |= paso[bit.bit_length() - 1]
+                    resto ^= bit
+                if destino:
+                    sucesores.append((symbol, destino))
+            resultado.append((mascara, sucesores))
+        conexion.send(resultado)
+    conexion.close()
+
+
+##############################################
+#      Importación y Exportación de          #
+#        Autómatas (JFLAP .jff y DOT)        #
+##############################################
+
+def load_jflap(path):
+    """
+    Carga un autómata finito desde un archivo JFLAP (.jff) con iterparse, liberando
+    cada elemento apenas se procesa para no mantener el árbol XML completo en memoria.
+    """
+    automaton = Automaton()
+    nombres = {}  # {id JFLAP: state_id}
+    pendientes = []
+    contenedor = None
+    for evento, elem in ET.iterparse(path, events=("start", "end")):
+        if evento == "start":
+            if elem.tag in {"structure", "automaton"}:
+                contenedor = elem
+            continue
+        if elem.tag == "type":
+            if (elem.text or "").strip() != "fa":
+                raise ValueError(f"Tipo de autómata JFLAP no soportado: {elem.text}")
+        elif elem.tag == "state":
+            state_id = elem.get("name") or f"q{elem.get('id')}"
+            automaton.add_state(state_id, is_accepting=elem.find("final") is not None)
+            nombres[elem.get("id")] = state_id
+            if elem.find("initial") is not None:
+                automaton.set_start_state(state_id)
+        elif elem.tag == "transition":
+            origen = (elem.findtext("from") or "").strip()
+            destino = (elem.findtext("to") or "").strip()
+            if not origen or not destino:
+                raise ValueError("JFLAP: transición sin <from> o <to>.")
+            symbol = elem.findtext("read") or "λ"
+            if origen in nombres and destino in nombres:
+                automaton.add_transition(nombres[origen], symbol, nombres[destino])
+            else:
+                pendientes.append((origen, symbol, destino))
+        else:
+            continue
+        if contenedor is not None:
+            contenedor.clear()
+    for origen, symbol, destino in pendientes:
+        if origen not in nombres or destino not in nombres:
+            raise ValueError("Ambos estados deben existir para poder hacer una transición.")
+        automaton.add_transition(nombres[origen], symbol, nombres[destino])
+    return automaton
+
+
+def save_jflap(automaton, path):
+    ids = {state: i for i, state in enumerate(automaton.states.values())}
+    with open(path, "w", encoding="utf-8") as archivo:
+        archivo.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n')
+        archivo.write("<structure>\n\t<type>fa</type>\n\t<automaton>\n")
+        for state, i in ids.items():
+            archivo.write(f"\t\t<state id=\"{i}\" name={quoteattr(state.state_id)}>")
+            if state is automaton.start_state:
+                archivo.write("<initial/>")
+            if state.is_accepting:
+                archivo.write("<final/>")
+            archivo.write("</state>\n")
+        for state, i in ids.items():
+            for symbol, targets in state.transitions.items():
+                read = "<read/>" if symbol == "λ" else f"<read>{escape(symbol)}</read>"
+                for target in targets:
+                    archivo.write(f"\t\t<transition><from>{i}</from><to>{ids[target]}</to>{read}</transition>\n")
+        archivo.write("\t</automaton>\n</structure>\n")
+
+
+_DOT_TOKEN = re.compile(r"""
+    \s+ | //[^\n]* | \#[^\n]* | /\*.*?\*/      # espacios y comentarios
+    | "(?:[^"\\]|\\.)*"                         # identificador entre comillas
+    | -> | -- | [{}\[\];,=:]                    # puntuación
+    | -?(?:\.\d+|\d+(?:\.\d*)?)                 # número
+    | [^\W\d]\w*                                # identificador simple
+""", re.S | re.X)
+_DOT_PUNTUACION = {"->", "--", "{", "}", "[", "]", ";", ",", "=", ":"}
+_DOT_INVISIBLES = {"none", "point", "plaintext"}
+
+
+def _dot_tokens(archivo):
+    # Tokeniza el archivo por bloques; un token que toca el final del bloque puede
+    # estar incompleto (cadena o comentario multilínea), así que se lee otro bloque.
+    buffer, pos, fin_archivo = "", 0, False
+    while True:
+        token = _DOT_TOKEN.match(buffer, pos)
+        if (token is None or token.end() == len(buffer)) and not fin_archivo:
+            bloque = archivo.read(1 << 16)
+            fin_archivo = not bloque
+            buffer, pos = buffer[pos:] + bloque, 0
+            continue
+        if token is None:
+            if pos == len(buffer):
+                return
+            raise ValueError(f"Sintaxis DOT no soportada cerca de: {buffer[pos:pos + 30]!r}")
+        pos = token.end()
+        texto = token.group(0)
+        if texto[0].isspace() or texto.startswith(("//", "#", "/*")):
+            continue
+        yield texto
+
+
+class _LectorDot:
+    # Analizador descendente de la gramática DOT (digraph) sobre el flujo de tokens.
+    # Respeta los atributos por defecto de `node`/`edge`, que se aplican a los nodos
+    # creados después, y rechaza con ValueError lo que no sabe interpretar
+    # (grafos no dirigidos, puertos, aristas hacia subgrafos, etiquetas HTML).
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.actual = next(tokens, None)
+        self.nodos = {}  # {nombre: atributos}
+        self.aristas = []  # [(origen, destino, etiqueta)]
+
+    def avanzar(self):
+        token = self.actual
+        self.actual = next(self.tokens, None)
+        return token
+
+    def esperar(self, esperado):
+        if self.actual != esperado:
+            raise ValueError(f"DOT: se esperaba '{esperado}' y se encontró {self.actual!r}")
+        return self.avanzar()
+
+    def es_palabra(self, *palabras):
+        return self.actual is not None and self.actual.lower() in palabras
+
+    def identificador(self):
+        token = self.actual
+        if token is None or token in _DOT_PUNTUACION:
+            raise ValueError(f"DOT: se esperaba un identificador y se encontró {token!r}")
+        self.avanzar()
+        if token.startswith('"'):
+            return re.sub(r'\\(.)', r'\1', token[1:-1])
+        return token
+
+    def grafo(self):
+        if self.es_palabra("strict"):
+            self.avanzar()
+        if self.es_palabra("graph"):
+            raise ValueError("Solo se soportan grafos dirigidos (digraph).")
+        if not self.es_palabra("digraph"):
+            raise ValueError(f"DOT: se esperaba 'digraph' y se encontró {self.actual!r}")
+        self.avanzar()
+        if self.actual != "{":
+            self.identificador()
+        self.esperar("{")
+        self.sentencias({}, {})
+        self.esperar("}")
+        if self.actual is not None:
+            raise ValueError(f"DOT: contenido inesperado después del grafo: {self.actual!r}")
+
+    def sentencias(self, nodo_defecto, arista_defecto):
+        while self.actual != "}":
+            if self.actual is None:
+                raise ValueError("DOT: falta '}' al final del grafo.")
+            self.sentencia(nodo_defecto, arista_defecto)
+            if self.actual == ";":
+                self.avanzar()
+
+    def sentencia(self, nodo_defecto, arista_defecto):
+        if self.es_palabra("node", "edge", "graph"):
+            tipo = self.avanzar().lower()
+            atributos = self.atributos()
+            if tipo == "node":
+                nodo_defecto.update(atributos)
+            elif tipo == "edge":
+                arista_defecto.update(atributos)
+            return
+        if self.es_palabra("subgraph") or self.actual == "{":
+            # Los subgrafos solo agrupan sentencias; sus valores por defecto son locales
+            if self.avanzar() != "{":
+                if self.actual != "{":
+                    self.identificador()
+                self.esperar("{")
+            self.sentencias(dict(nodo_defecto), dict(arista_defecto))
+            self.esperar("}")
+            if self.actual in {"->", "--"}:
+                raise ValueError("DOT: las aristas con subgrafos no están soportadas.")
+            return
+        nombre = self.identificador()
+        if self.actual == "=":  # Atributo del grafo
+            self.avanzar()
+            self.identificador()
+            return
+        cadena = [nombre]
+        while self.actual in {"->", "--", ":"}:
+            if self.actual == "--":
+                raise ValueError("Solo se soportan aristas dirigidas (->).")
+            if self.actual == ":":
+                raise ValueError("DOT: los puertos de nodo no están soportados.")
+            self.avanzar()
+            if self.es_palabra("subgraph") or self.actual == "{":
+                raise ValueError("DOT: las aristas con subgrafos no están soportadas.")
+            cadena.append(self.identificador())
+        if len(cadena) == 1:
+            self.declarar(nombre, nodo_defecto, self.atributos())
+            return
+        atributos = dict(arista_defecto)
+        atributos.update(self.atributos())
+        for nodo in cadena:
+            self.declarar(nodo, nodo_defecto)
+        for origen, destino in zip(cadena, cadena[1:]):
+            self.aristas.append((origen, destino, atributos.get("label")))
+
+    def declarar(self, nombre, nodo_defecto, atributos=None):
+        if nombre not in self.nodos:
+            self.nodos[nombre] = dict(nodo_defecto)
+        if atributos:
+            self.nodos[nombre].update(atributos)
+
+    def atributos(self):
+        atributos = {}
+        while self.actual == "[":
+            self.avanzar()
+            while self.actual != "]":
+                clave = self.identificador()
+                self.esperar("=")
+                atributos[clave] = self.identificador()
+                if self.actual in {",", ";"}:
+                    self.avanzar()
+            self.avanzar()
+        return atributos
+
+
+def load_dot(path):
+    """
+    Carga un autómata desde un digrafo de Graphviz. El archivo se tokeniza por bloques,
+    así que admite varias sentencias por línea separadas por ';' y atributos por
+    defecto (node [shape=doublecircle]). Los nodos con forma doublecircle son de
+    aceptación y la arista que sale de un nodo invisible (shape=none, point o
+    plaintext) marca el estado inicial. Lo que no se puede interpretar produce ValueError.
+    """
+    with open(path, encoding="utf-8") as archivo:
+        lector = _LectorDot(_dot_tokens(archivo))
+        lector.grafo()
+    automaton = Automaton()
+    invisibles = {nombre for nombre, atributos in lector.nodos.items()
+                  if atributos.get("shape") in _DOT_INVISIBLES}
+    for nombre, atributos in lector.nodos.items():
+        if nombre not in invisibles:
+            automaton.add_state(nombre, is_accepting=atributos.get("shape") == "doublecircle")
+    inicial = None
+    for origen, destino, etiqueta in lector.aristas:
+        if destino in invisibles:
+            raise ValueError(f"DOT: arista hacia el nodo invisible {destino}.")
+        if origen in invisibles:
+            if inicial not in (None, destino):
+                raise ValueError("DOT: el autómata tiene más de un estado inicial.")
+            inicial = destino
+            continue
+        symbol = etiqueta or "λ"
+        automaton.add_transition(origen, "λ" if symbol == "ε" else symbol, destino)
+    if inicial is not None:
+        automaton.set_start_state(inicial)
+    return automaton
+
+
+def _dot_quote(texto):
+    return '"' + texto.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def save_dot(automaton, path):
+    with open(path, "w", encoding="utf-8") as archivo:
+        archivo.write("digraph {\n")
+        if automaton.start_state:
+            archivo.write('\t"__start__" [shape=none label=""]\n')
+        for state_id, state in automaton.states.items():
+            shape = "doublecircle" if state.is_accepting else "circle"
+            archivo.write(f"\t{_dot_quote(state_id)} [shape={shape} label={_dot_quote(state_id)}]\n")
+        if automaton.start_state:
+            archivo.write(f'\t"__start__" -> {_dot_quote(automaton.start_state.state_id)}\n')
+        for state_id, state in automaton.states.items():
+            for symbol, targets in state.transitions.items():
+                for target in targets:
+                    archivo.write(f"\t{_dot_quote(state_id)} -> {_dot_quote(target.state_id)} "
+                                  f"[label={_dot_quote(symbol)}]\n")
+        archivo.write("}\n")
+
+
 ##############################################
 #         Función para Renderizar y         #
 #       Mostrar autómatas con Graphviz       #
@@ -422,6 +1520,12 @@ class AutomataGUI:
         clear_btn = ttk.Button(toolbar, text="Borrar todo", command=self.clear_canvas)
         clear_btn.pack(side='left', padx=5)
 
+        import_btn = ttk.Button(toolbar, text="Importar", command=self.import_automaton)
+        import_btn.pack(side='left', padx=5)
+
+        export_btn = ttk.Button(toolbar, text="Exportar", command=self.export_automaton)
+        export_btn.pack(side='left', padx=5)
+
         back_btn = ttk.Button(toolbar, text="Volver al Menú Principal", command=self.go_back_to_main_menu)
         back_btn.pack(side='left', padx=5)
 
@@ -543,7 +1647,7 @@ class AutomataGUI:
         lambda_btn.pack(pady=5)
         def confirm():
             symbol = entry.get()
-            if symbol:
+            if symbol and not self.automaton.has_transition(self.transition_start, target_state, symbol):
                 self.automaton.add_transition(self.transition_start, symbol, target_state)
                 self.draw_transition(self.transition_start, target_state, symbol)
             self.transition_start = None
@@ -676,6 +1780,38 @@ class AutomataGUI:
                     to_x, to_y = state_positions[target.state_id]
                     self.draw_transition(state_id, target.state_id, symbol)
 
+    def import_automaton(self):
+        path = filedialog.askopenfilename(filetypes=[("JFLAP", "*.jff"), ("Graphviz DOT", "*.dot *.gv")])
+        if not path:
+            return
+        try:
+            if path.endswith(".jff"):
+                automaton = load_jflap(path)
+            else:
+                automaton = load_dot(path)
+            if not automaton.start_state:
+                raise ValueError("The automaton has no start state defined.")
+            # Los ids importados (p. ej. "0", "1") no sirven como tags del canvas y podrían
+            # chocar con los estados creados después: se renombran a q0, q1, ...
+            automaton.rename_states_sequentially()
+            self.layout_states_circular(automaton)
+            self.state_counter = len(automaton.states)
+        except (ValueError, OSError, ET.ParseError) as e:
+            messagebox.showerror("Error", str(e))
+
+    def export_automaton(self):
+        path = filedialog.asksaveasfilename(defaultextension=".jff",
+                                            filetypes=[("JFLAP", "*.jff"), ("Graphviz DOT", "*.dot *.gv")])
+        if not path:
+            return
+        try:
+            if path.endswith(".jff"):
+                save_jflap(self.automaton, path)
+            else:
+                save_dot(self.automaton, path)
+        except OSError as e:
+            messagebox.showerror("Error", str(e))
+
     def create_state_at_fixed_position(self, state_id, is_accepting):
         x = 100 + (self.state_counter % 5) * 150
         y = 100 + (self.state_counter // 5) * 150
@@ -729,7 +1865,7 @@ class InterfazGraficaRegex:
         title_label = ttk.Label(frame, text="Conversor de Expresiones Regulares a Autómatas", font=("Bahnschrift", 16, "bold"))
         title_label.pack(pady=10)
         
-        instruction_label = ttk.Label(frame, text="1. a·b = ab    2. aUb = a|b", font=("Bahnschrift", 12))
+        instruction_label = ttk.Label(frame, text="1. a·b = ab    2. aUb = a|b    3. a{2,4} = entre 2 y 4 veces a (cota máx. 100)", font=("Bahnschrift", 12))
         instruction_label.pack(pady=5)
         
         expr_label = ttk.Label(frame, text="Ingrese la expresión regular:", font=("Bahnschrift", 12))
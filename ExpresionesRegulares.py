@@ -1,23 +1,87 @@
+import re
+
+# Cota máxima de {m,n} al construir autómatas: construir_desde_postfix crea una copia
+# del cuerpo por cada repetición. CountingMatcher valida sin esta cota.
+LIMITE_REPETICION = 100
+
+
+def tokenizar(expresion):
+    """
+    Divide una expresión (infija o postfix) en tokens. Cada repetición acotada
+    '{m}', '{m,}' o '{m,n}' es un único token; el resto de caracteres son tokens sueltos.
+    """
+    tokens = []
+    i = 0
+    while i < len(expresion):
+        if expresion[i] == '{':
+            fin = expresion.find('}', i)
+            if fin == -1:
+                fin = len(expresion) - 1
+            tokens.append(expresion[i:fin + 1])
+            i = fin + 1
+        else:
+            tokens.append(expresion[i])
+            i += 1
+    return tokens
+
+
+def es_repeticion(token):
+    return token.startswith('{')
+
+
+def rango_repeticion(token):
+    """
+    Retorna (mínimo, máximo) de un token de repetición; máximo es None en '{m,}'.
+    """
+    partes = token[1:-1].split(',')
+    minimo = int(partes[0])
+    if len(partes) == 1:
+        return minimo, minimo
+    return minimo, int(partes[1]) if partes[1] else None
+
+
 class ExpresionRegular:
     def __init__(self, expresion):
         self.expresion = expresion
-    def validar_expresion(self):
+    def validar_expresion(self, limite_repeticion=LIMITE_REPETICION):
         """
         Valida que la expresión regular esté balanceada en términos de paréntesis
-        y que los operadores estén correctamente colocados.
+        y que los operadores estén correctamente colocados. Las cotas de las
+        repeticiones {m,n} no pueden superar `limite_repeticion` (None = sin cota).
 
         Retorna:
         - True si la expresión es válida.
         - False si la expresión es inválida.
         """
         pila = []  # Pila para verificar paréntesis balanceados
-        caracteres_validos = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789()|*&+")
+        caracteres_validos = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789()|*&+{")
+        fin_repeticion = 0
 
         for i, char in enumerate(self.expresion):
+            # Los caracteres dentro de una repetición {m,n} ya fueron validados
+            if i < fin_repeticion:
+                continue
+
             # Verificar si el carácter es válido
             if char not in caracteres_validos:
                 return False, f"Carácter no válido: '{char}' en la posición {i}"
 
+            # Verificar repetición acotada {m}, {m,} o {m,n}
+            if char == '{':
+                repeticion = re.match(r'\{\d+(,\d*)?\}', self.expresion[i:])
+                if not repeticion:
+                    return False, f"Repetición mal formada en la posición {i}"
+                if i == 0 or self.expresion[i - 1] in {'|', '&', '('}:
+                    return False, f"Repetición '{repeticion.group(0)}' en posición inválida: {i}"
+                minimo, maximo = rango_repeticion(repeticion.group(0))
+                if maximo is not None and maximo < minimo:
+                    return False, f"Repetición con mínimo mayor que el máximo en la posición {i}"
+                if limite_repeticion is not None and max(minimo, maximo or 0) > limite_repeticion:
+                    return False, (f"Repetición '{repeticion.group(0)}' en la posición {i} supera "
+                                   f"el límite de {limite_repeticion}")
+                fin_repeticion = i + len(repeticion.group(0))
+                continue
+
             # Verificar paréntesis balanceados
             if char == '(':
                 pila.append(char)
@@ -60,11 +124,11 @@ class ExpresionRegular:
         """
         procesada = []
         prev_char = None
-        for char in self.expresion:
+        for char in tokenizar(self.expresion):
             if prev_char is not None:
-                prev_is_symbol = prev_char not in {'*','+', '|', '(', ')', '&'}
-                curr_is_symbol = char not in {'*','+', '|', '(', ')', '&'}
-                if (prev_char in {'*', ')', '&','+'} or prev_is_symbol) and (char == '(' or curr_is_symbol):
+                prev_is_symbol = prev_char not in {'*','+', '|', '(', ')', '&'} and not es_repeticion(prev_char)
+                curr_is_symbol = char not in {'*','+', '|', '(', ')', '&'} and not es_repeticion(char)
+                if (prev_char in {'*', ')', '&','+'} or es_repeticion(prev_char) or prev_is_symbol) and (char == '(' or curr_is_symbol):
                     procesada.append('&')  # Usamos & para concatenación
             procesada.append(char)
             prev_char = char
@@ -78,9 +142,11 @@ class ExpresionRegular:
         - La expresión regular en notación postfix.
         """
         expresion_preprocesada = self.preprocesar()
-        tokens = list(expresion_preprocesada)
+        tokens = tokenizar(expresion_preprocesada)
 
         precedencia = {'|': 1, '&': 2, '*': 3, '+': 3}  # Usamos & para concatenación
+        # Las repeticiones {m,n} son operadores posfijos como * y +
+        prioridad = lambda token: 3 if es_repeticion(token) else precedencia[token]
         salida = []
         pila = []
 
@@ -91,8 +157,8 @@ class ExpresionRegular:
                 while pila and pila[-1] != '(':
                     salida.append(pila.pop())
                 pila.pop()  # Eliminar el '(' de la pila
-            elif token in precedencia:
-                while pila and pila[-1] != '(' and precedencia[pila[-1]] >= precedencia[token]:
+            elif token in precedencia or es_repeticion(token):
+                while pila and pila[-1] != '(' and prioridad(pila[-1]) >= prioridad(token):
                     salida.append(pila.pop())
                 pila.append(token)
             else:
@@ -102,3 +168,101 @@ class ExpresionRegular:
             salida.append(pila.pop())
 
         return ''.join(salida)
+
+    def extraer_literales(self, limite=16):
+        """
+        Analiza la expresión en notación postfix y extrae literales obligatorios que
+        permiten prefiltrar búsquedas no ancladas.
+
+        Retorna:
+        - prefijos: conjunto de cadenas tal que toda coincidencia empieza por alguna de ellas.
+        - factores: conjunto de cadenas tal que toda coincidencia contiene alguna de ellas.
+        En ambos casos {""} indica que no se encontró ningún literal obligatorio.
+        """
+        pila = []
+        for token in tokenizar(self.convertir_a_postfix()):
+            if token == '&':
+                b = pila.pop()
+                a = pila.pop()
+                exacto = None
+                if a['exacto'] and b['exacto']:
+                    exacto = _producto(a['exacto'], b['exacto'], limite)
+                prefijos = _producto(a['exacto'], b['prefijos'], limite) if a['exacto'] else None
+                sufijos = _producto(a['sufijos'], b['exacto'], limite) if b['exacto'] else None
+                cruce = _producto(a['sufijos'], b['prefijos'], limite)
+                pila.append({
+                    'exacto': exacto,
+                    'prefijos': prefijos or a['prefijos'],
+                    'sufijos': sufijos or b['sufijos'],
+                    'factores': _mejor([a['factores'], b['factores'], cruce, exacto]),
+                })
+            elif token == '|':
+                b = pila.pop()
+                a = pila.pop()
+                exacto = None
+                if a['exacto'] and b['exacto']:
+                    exacto = _union(a['exacto'], b['exacto'], limite)
+                pila.append({
+                    'exacto': exacto,
+                    'prefijos': _union(a['prefijos'], b['prefijos'], limite) or {""},
+                    'sufijos': _union(a['sufijos'], b['sufijos'], limite) or {""},
+                    'factores': _union(a['factores'], b['factores'], limite) or {""},
+                })
+            elif token == '*':
+                pila.pop()
+                pila.append({'exacto': None, 'prefijos': {""}, 'sufijos': {""}, 'factores': {""}})
+            elif token == '+':
+                a = pila.pop()
+                pila.append(dict(a, exacto=None))
+            elif es_repeticion(token):
+                a = pila.pop()
+                minimo, maximo = rango_repeticion(token)
+                if minimo == 0:
+                    exacto = {""} if maximo == 0 else None
+                    pila.append({'exacto': exacto, 'prefijos': {""}, 'sufijos': {""}, 'factores': {""}})
+                    continue
+                exacto = None
+                if a['exacto'] and minimo == maximo and len(a['exacto']) == 1:
+                    exacto = {next(iter(a['exacto'])) * minimo}
+                elif a['exacto'] and minimo == maximo:
+                    exacto = a['exacto']
+                    for _ in range(minimo - 1):
+                        exacto = _producto(exacto, a['exacto'], limite)
+                        if exacto is None:
+                            break
+                pila.append({
+                    'exacto': exacto,
+                    'prefijos': exacto or a['prefijos'],
+                    'sufijos': exacto or a['sufijos'],
+                    'factores': _mejor([a['factores'], exacto]),
+                })
+            else:
+                pila.append({'exacto': {token}, 'prefijos': {token}, 'sufijos': {token}, 'factores': {token}})
+        if not pila:
+            return {""}, {""}
+        resultado = pila.pop()
+        return resultado['prefijos'], resultado['factores']
+
+
+def _normalizar(literales):
+    # Un conjunto que contiene la cadena vacía no impone ninguna restricción
+    return {""} if "" in literales else literales
+
+
+def _producto(izquierda, derecha, limite):
+    if len(izquierda) * len(derecha) > limite:
+        return None
+    return _normalizar({x + y for x in izquierda for y in derecha})
+
+
+def _union(izquierda, derecha, limite):
+    union = izquierda | derecha
+    if len(union) > limite:
+        return None
+    return _normalizar(union)
+
+
+def _mejor(candidatos):
+    # Prefiere el conjunto cuyo literal más corto sea más largo y, a igualdad, el más pequeño
+    candidatos = [c for c in candidatos if c]
+    return max(candidatos, key=lambda c: (min(len(x) for x in c), -len(c)))